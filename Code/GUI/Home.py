@@ -1,23 +1,143 @@
 # Code/GUI/Home.py
 import os
 import sys
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QParallelAnimationGroup
+import time
+from functools import lru_cache
+from PyQt6.QtCore import (
+    Qt, QEvent, QPropertyAnimation, QEasingCurve, QParallelAnimationGroup, QTimer,
+    QObject, QRunnable, QThreadPool, QSignalBlocker, pyqtSignal, pyqtSlot
+)
 from PyQt6.QtGui import QPixmap
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QFileDialog, QProgressBar, QFrame, QSizePolicy, QScrollArea, QApplication, QLabel
+    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QButtonGroup, QFileDialog, QProgressBar, QFrame, QSizePolicy, QScrollArea, QApplication, QLabel
 )
 from qfluentwidgets import (
     CardWidget, IconWidget, BodyLabel, CaptionLabel, 
     PrimaryPushButton, PushButton, CheckBox,
-    TitleLabel, SubtitleLabel, FluentIcon, InfoBarPosition, setThemeColor,
+    TitleLabel, SubtitleLabel, FluentIcon, InfoBarPosition,
     FluentWindow, SwitchButton, DoubleSpinBox, ScrollArea
 )
 
-from Code.GUI.Workers import SMTWorker
 from Code.GUI.Results import ResultsWidget
 from Code.GUI.Notifications import SafeInfoBar as InfoBar
 
+
+def _run_button_qss(mode_name, color_hex):
+    """Build the run button rules for one value of its `mode` property."""
+    sel = f'PrimaryPushButton[mode="{mode_name}"]'
+    return f"""
+            {sel} {{ background-color: {color_hex}; border: 1px solid {color_hex}; border-radius: 6px; color: white; height: 40px; font-size: 16px; font-weight: bold; }}
+            {sel}:hover {{ background-color: {color_hex}; border: 1px solid {color_hex}; }}
+            {sel}:pressed {{ background-color: {color_hex}; opacity: 0.8; }}
+            {sel}:disabled {{ background-color: {color_hex}; opacity: 0.5; border: 1px solid {color_hex}; color: rgba(255, 255, 255, 0.8); }}
+        """
+
+
+# Initial (energy, use, CO2) weights shown when the weights card is first built
+_DEFAULT_WEIGHTS = (0.4, 0.3, 0.3)
+
+# The run button's stylesheet is applied once; switching modes only flips
+# its `mode` property, so Qt never has to reparse the stylesheet.
+_COLOR_BY_MODE = {0: "#107C10", 1: "#FF8C00"}
+_RUN_BUTTON_MODE = {0: "smt", 1: "opt"}
+_RUN_BUTTON_QSS = "".join(_run_button_qss(_RUN_BUTTON_MODE[idx], _COLOR_BY_MODE[idx]) for idx in (0, 1))
+
+
+@lru_cache(maxsize=None)
+def _default_user_dir():
+    """Prefer Downloads; fall back to user home if Downloads doesn't exist. Resolved once."""
+    downloads = os.path.normpath(os.path.join(os.path.expanduser("~"), "Downloads"))
+    return downloads if os.path.isdir(downloads) else os.path.expanduser("~")
+
+
+# Dialogs keep returning the same few paths; memoize their normalization.
+_norm = lru_cache(maxsize=128)(os.path.normpath)
+
+
+# Resource file types accepted by the calculation worker
+_RESOURCE_EXTENSIONS = ('.xml', '.aasx', '.json')
+
+# Seconds a checked export path is trusted before it is stat'ed again
+_EXPORT_PROBE_TTL = 2.0
+
+
+class _ResourceScanSignals(QObject):
+    """Signals for _ResourceScanRunnable; QRunnable itself cannot emit."""
+    # (scanned directory, number of resource files or -1 if unreadable)
+    finished = pyqtSignal(str, int)
+
+
+class _ResourceScanRunnable(QRunnable):
+    """Count resource files in a directory on the thread pool so slow mounts don't block the GUI."""
+
+    def __init__(self, resource_dir):
+        super().__init__()
+        self.resource_dir = resource_dir
+        self.signals = _ResourceScanSignals()
+
+    def run(self):
+        count = 0
+        try:
+            with os.scandir(self.resource_dir) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(_RESOURCE_EXTENSIONS):
+                        count += 1
+        except OSError:
+            count = -1
+        self.signals.finished.emit(self.resource_dir, count)
+
+
+class _PathProbeSignals(QObject):
+    """Signals for _PathProbeRunnable."""
+    # (probed path, whether it exists)
+    finished = pyqtSignal(str, bool)
+
+
+class _PathProbeRunnable(QRunnable):
+    """Check whether a path exists on the thread pool; a sleeping or network disk can stall stat()."""
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.signals = _PathProbeSignals()
+
+    def run(self):
+        self.signals.finished.emit(self.path, os.path.exists(self.path))
+
+
+# Primary screen work area; refreshed only when the screen or its geometry changes
+_screen_geom_cache = {}
+
+
+def _invalidate_screen_geom(*_):
+    _screen_geom_cache.pop("geom", None)
+
+
+def _on_primary_screen_changed(screen):
+    _invalidate_screen_geom()
+    if screen is not None:
+        screen.availableGeometryChanged.connect(_invalidate_screen_geom)
+
+
+def _cached_screen_geom():
+    """Return the primary screen's available geometry without querying it on every call."""
+    geom = _screen_geom_cache.get("geom")
+    if geom is None:
+        screen = QApplication.primaryScreen()
+        if screen is None:
+            return None
+        if not _screen_geom_cache.get("hooked"):
+            QApplication.instance().primaryScreenChanged.connect(_on_primary_screen_changed)
+            screen.availableGeometryChanged.connect(_invalidate_screen_geom)
+            _screen_geom_cache["hooked"] = True
+        geom = _screen_geom_cache["geom"] = screen.availableGeometry()
+    return geom
+
+
 class HomePage(QWidget):
+    # Set SMT_NO_ANIM=1 to switch cards instantly (headless/scripted runs, accessibility)
+    _ANIMATE = not os.environ.get("SMT_NO_ANIM")
+
     def __init__(self, log_callback, parent=None):
         super().__init__(parent)
         """Main landing page that gathers user input and triggers result calculations."""
@@ -27,32 +147,66 @@ class HomePage(QWidget):
         # --- Variables ---
         self.recipe_path = ""
         self.resource_dir = ""
-        self.default_export_path = self._default_user_dir()
+        self.resource_file_count = None
+        self.default_export_path = _default_user_dir()
         self.current_export_path = self.default_export_path
         self.mode_index = 0
-        self.prev_vals = {}
+        self._prev_weights = list(_DEFAULT_WEIGHTS)
+        self._weights_target_h = 0
+        self._weights_target_w = -1  # card width the cached height was measured at
         self.anim = None 
         self.split_anim = None
-        self.worker = None
-        
-        setThemeColor("#00629B")
+        self._worker_signals = None
+        self._worker_active = False
+        self._streamed_results = False
+        self._run_style_mode = None
+        self._recipe_dialog = None
+        self._folder_dialog = None
+        self._export_dialog = None
+        self._hooks = None
+        self._export_probe_pending = False
+        # (path, exists, monotonic time) of the last export path check; reused for a short while
+        self._export_path_exists_cache = (self.default_export_path, True, time.monotonic())
+
+        # Coalesce rapid spin box edits into a single rebalance
+        self._pending_balance = None
+        self._balance_timer = QTimer(self)
+        self._balance_timer.setSingleShot(True)
+        self._balance_timer.setInterval(50)
+        self._balance_timer.timeout.connect(self._flush_pending_balance)
+
+        # Repaint the progress bar at most ~30 times per second
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
+        # Collapse bursts of worker errors into one InfoBar per 500 ms window
+        self._err_queue = []
+        self._run_info = None  # (InfoBar factory, content, widget) of the last run outcome shown
+        self._err_timer = QTimer(self)
+        self._err_timer.setSingleShot(True)
+        self._err_timer.setInterval(500)
+        self._err_timer.timeout.connect(self._flush_errors)
+
+        # Re-split the panels at most once per frame while the window is being resized
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._apply_right_width)
         
         self.init_ui()
 
     @staticmethod
     def _prefer_reduced_motion() -> bool:
-        """Use simpler UI transitions on macOS for stability."""
-        return sys.platform == "darwin"
+        """Use simpler UI transitions on macOS for stability, or when animations are disabled."""
+        return sys.platform == "darwin" or not HomePage._ANIMATE
 
     def _get_logo_path(self):
         """Return absolute path of the RWTH logo image in this package."""
         return os.path.join(os.path.dirname(__file__), "rwth_logo.png")
 
-    def _default_user_dir(self):
-        """Prefer Downloads; fall back to user home if Downloads doesn't exist."""
-        downloads = os.path.normpath(os.path.join(os.path.expanduser("~"), "Downloads"))
-        return downloads if os.path.isdir(downloads) else os.path.expanduser("~")
-
     def _program_dir(self):
         """Return the directory where the application/script is located."""
         program_path = os.path.abspath(sys.argv[0]) if sys.argv and sys.argv[0] else os.getcwd()
@@ -60,14 +214,18 @@ class HomePage(QWidget):
 
     @staticmethod
     def _dialog_options():
-        """Use native dialogs on Windows; keep non-native style on macOS/others."""
-        options = QFileDialog.Option(0)
+        """
+        Use native dialogs on Windows; keep non-native style on macOS/others.
+        Custom directory icons and symlink resolution are disabled so large or
+        networked folders don't stat every entry before the dialog shows.
+        """
+        options = QFileDialog.Option.DontUseCustomDirectoryIcons | QFileDialog.Option.DontResolveSymlinks
         if os.name != "nt":
             options |= QFileDialog.Option.DontUseNativeDialog
         return options
 
-    def _open_file_dialog(self, title: str, start_dir: str, name_filter: str) -> str:
-        """Open a single-file picker with explicit title."""
+    def _create_file_dialog(self, title: str, start_dir: str, name_filter: str) -> QFileDialog:
+        """Create a single-file picker with explicit title."""
         dialog = QFileDialog(self)
         dialog.setWindowTitle(title)
         dialog.setDirectory(start_dir)
@@ -75,29 +233,21 @@ class HomePage(QWidget):
         dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
         dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
         dialog.setOptions(self._dialog_options())
-        if dialog.exec():
-            files = dialog.selectedFiles()
-            if files:
-                return files[0]
-        return ""
-
-    def _open_directory_dialog(self, title: str, start_dir: str) -> str:
-        """Open a directory picker with explicit title."""
+        return dialog
+
+    def _create_directory_dialog(self, title: str, start_dir: str) -> QFileDialog:
+        """Create a directory picker with explicit title."""
         dialog = QFileDialog(self)
         dialog.setWindowTitle(title)
         dialog.setDirectory(start_dir)
         dialog.setFileMode(QFileDialog.FileMode.Directory)
-        dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
-        if os.name != "nt":
-            dialog.setOption(QFileDialog.Option.DontUseNativeDialog, True)
-        if dialog.exec():
-            dirs = dialog.selectedFiles()
-            if dirs:
-                return dirs[0]
-        return ""
-        
+        dialog.setOptions(self._dialog_options() | QFileDialog.Option.ShowDirsOnly)
+        return dialog
+
     def init_ui(self):
         """Build the overall two-panel layout and wire initial UI components."""
+        # Suspend repaints so the cards are laid out and painted in one pass.
+        self.setUpdatesEnabled(False)
         self.main_layout = QHBoxLayout(self)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
         self.main_layout.setSpacing(0)
@@ -129,6 +279,7 @@ class HomePage(QWidget):
         self.right_layout.addWidget(self.results_widget)
         
         self.main_layout.addWidget(self.right_container, 0)
+        self.setUpdatesEnabled(True)
 
     def _init_left_panel_content(self):
         """Create the configuration cards on the left side (file pickers, mode, weights)."""
@@ -222,8 +373,12 @@ class HomePage(QWidget):
         self.cb_opt = CheckBox("Get All Results Sorted by Weighted Cost", self)
         self.cb_smt.setChecked(True)
         self.cb_opt.setChecked(False)
-        self.cb_smt.stateChanged.connect(self.on_smt_checked)
-        self.cb_opt.stateChanged.connect(self.on_opt_checked)
+        # Exclusive group keeps exactly one mode checked; button ids are the mode indices
+        self.mode_group = QButtonGroup(self)
+        self.mode_group.setExclusive(True)
+        self.mode_group.addButton(self.cb_smt, 0)
+        self.mode_group.addButton(self.cb_opt, 1)
+        self.mode_group.idToggled.connect(self.on_mode_toggled)
         l_mode.addWidget(icon_mode)
         l_mode.addWidget(lbl_mode)
         l_mode.addStretch(1)
@@ -232,48 +387,12 @@ class HomePage(QWidget):
         l_mode.addWidget(self.cb_opt)
         layout.addWidget(self.card_mode)
 
-        # 5. Weights
-        self.card_weights = CardWidget(self)
-        l_weights = QVBoxLayout(self.card_weights)
-        l_weights.setContentsMargins(20, 20, 20, 20)
-        l_weights.setSpacing(10)
-        w_header = QHBoxLayout()
-        w_header.setContentsMargins(0,0,0,0)
-        w_title = SubtitleLabel("Optimization Weights (Sum = 1.0)", self)
-        w_header.addWidget(w_title)
-        w_header.addStretch(1)
-        l_weights.addLayout(w_header)
-        
-        def create_weight_row(label, default_val):
-            row = QHBoxLayout()
-            row.setContentsMargins(0, 0, 0, 0)
-            lbl = BodyLabel(label, self)
-            spin = DoubleSpinBox(self)
-            spin.setRange(0.0, 1.0)
-            spin.setSingleStep(0.1)
-            spin.setValue(default_val)
-            row.addWidget(lbl)
-            row.addStretch(1)
-            row.addWidget(spin)
-            return row, spin
-            
-        r1, self.spin_energy = create_weight_row("Energy Cost Weight", 0.4)
-        r2, self.spin_use = create_weight_row("Use Cost Weight", 0.3)
-        r3, self.spin_co2 = create_weight_row("CO2 Footprint Weight", 0.3)
-        l_weights.addLayout(r1)
-        l_weights.addLayout(r2)
-        l_weights.addLayout(r3)
-        layout.addWidget(self.card_weights)
-        
-        self.prev_vals = {self.spin_energy: 0.4, self.spin_use: 0.3, self.spin_co2: 0.3}
-        self.spin_energy.valueChanged.connect(lambda v: self.balance_weights(self.spin_energy, v))
-        self.spin_use.valueChanged.connect(lambda v: self.balance_weights(self.spin_use, v))
-        self.spin_co2.valueChanged.connect(lambda v: self.balance_weights(self.spin_co2, v))
-        self.card_weights.setMaximumHeight(0)
-        self.card_weights.setVisible(False)
+        # 5. Weights (built on first switch to weighted mode, see _build_weights_card)
+        self.card_weights = None
 
         # Button & Progress
         self.btn_run = PrimaryPushButton("Start Calculation (All Results)", self)
+        self.btn_run.setStyleSheet(_RUN_BUTTON_QSS)
         self.btn_run.setEnabled(False)
         self.btn_run.clicked.connect(self.run_process)
         layout.addWidget(self.btn_run)
@@ -302,6 +421,52 @@ class HomePage(QWidget):
 
         self.update_run_button_style(0)
 
+    def _build_weights_card(self):
+        """Create the optimization weights card the first time weighted mode is selected."""
+        self.left_container.setUpdatesEnabled(False)
+        self.card_weights = CardWidget(self)
+        l_weights = QVBoxLayout(self.card_weights)
+        l_weights.setContentsMargins(20, 20, 20, 20)
+        l_weights.setSpacing(10)
+        w_header = QHBoxLayout()
+        w_header.setContentsMargins(0,0,0,0)
+        w_title = SubtitleLabel("Optimization Weights (Sum = 1.0)", self)
+        w_header.addWidget(w_title)
+        w_header.addStretch(1)
+        l_weights.addLayout(w_header)
+        
+        # One grid for all rows: labels in column 0, stretch in column 1, spin boxes in column 2
+        grid = QGridLayout()
+        grid.setContentsMargins(0, 0, 0, 0)
+        grid.setVerticalSpacing(10)
+        grid.setColumnStretch(1, 1)
+        labels = ("Energy Cost Weight", "Use Cost Weight", "CO2 Footprint Weight")
+        self._weight_spins = []
+        for i, (label, default_val) in enumerate(zip(labels, _DEFAULT_WEIGHTS)):
+            spin = DoubleSpinBox(self)
+            spin.setRange(0.0, 1.0)
+            spin.setSingleStep(0.1)
+            spin.setValue(default_val)
+            grid.addWidget(BodyLabel(label, self), i, 0)
+            grid.addWidget(spin, i, 2)
+            self._weight_spins.append(spin)
+        self.spin_energy, self.spin_use, self.spin_co2 = self._weight_spins
+        l_weights.addLayout(grid)
+        index = self.left_layout.indexOf(self.card_mode) + 1
+        self.left_layout.insertWidget(index, self.card_weights)
+        
+        self._prev_weights = list(_DEFAULT_WEIGHTS)
+        for spin in self._weight_spins:
+            spin.valueChanged.connect(self._on_weight_changed)
+        self.card_weights.setMaximumHeight(0)
+        self.card_weights.setVisible(False)
+        if not self._prefer_reduced_motion():
+            self.anim = QPropertyAnimation(self.card_weights, b"maximumHeight", self)
+            self.anim.setDuration(300)
+            self.anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+            self.anim.finished.connect(self._on_weights_anim_finished)
+        self.left_container.setUpdatesEnabled(True)
+
     # -----------------------------------------------------
     # Window Resize & Animation Logic
     # -----------------------------------------------------
@@ -312,6 +477,7 @@ class HomePage(QWidget):
         Args:
             show: True to expand the weights card; False to collapse.
         """
+        if self.card_weights is None: return
         if show and self.card_weights.isVisible() and self.card_weights.maximumHeight() > 0: return
         if not show and not self.card_weights.isVisible(): return
 
@@ -324,10 +490,12 @@ class HomePage(QWidget):
                 self.card_weights.setVisible(False)
             return
 
-        # 1. Measure target height
-        self.card_weights.setMaximumHeight(16777215) 
-        self.card_weights.adjustSize()
-        target_height = self.card_weights.sizeHint().height()
+        # 1. Target height (re-measured only when the card's width or font changed)
+        card_w = self.card_weights.width()
+        if not self._weights_target_h or card_w != self._weights_target_w:
+            self._weights_target_h = self.card_weights.sizeHint().height()
+            self._weights_target_w = card_w
+        target_height = self._weights_target_h
 
         # 2. [New] Resize Window Logic
         if show:
@@ -335,16 +503,12 @@ class HomePage(QWidget):
             if win:
                 current_h = win.height()
                 new_h = current_h + target_height + 20 
-                screen = QApplication.primaryScreen()
-                if screen:
-                    available_geo = screen.availableGeometry()
-                    if new_h < available_geo.height():
-                        win.resize(win.width(), new_h)
-
-        # 3. Start Animation
-        self.anim = QPropertyAnimation(self.card_weights, b"maximumHeight")
-        self.anim.setDuration(300) 
-        self.anim.setEasingCurve(QEasingCurve.Type.OutCubic) 
+                available_geo = _cached_screen_geom()
+                if available_geo is not None and new_h < available_geo.height():
+                    win.resize(win.width(), new_h)
+
+        # 3. Start Animation (one animation object is reused for every toggle)
+        self.anim.stop()
         if show:
             self.card_weights.setVisible(True)
             self.anim.setStartValue(0)
@@ -352,9 +516,13 @@ class HomePage(QWidget):
         else:
             self.anim.setStartValue(target_height)
             self.anim.setEndValue(0)
-            self.anim.finished.connect(lambda: self.card_weights.setVisible(False))
         self.anim.start()
 
+    def _on_weights_anim_finished(self):
+        """Hide the weights card once a collapse animation has finished."""
+        if self.anim.endValue() == 0:
+            self.card_weights.setVisible(False)
+
     def toggle_results_panel(self, show=True):
         """Slide the results panel open/closed by animating its width."""
         parent_width = self.width()
@@ -364,89 +532,110 @@ class HomePage(QWidget):
         if start_width == target_width:
             return
 
-        self.split_anim = QPropertyAnimation(self.right_container, b"minimumWidth")
-        self.split_anim.setDuration(500) 
-        self.split_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-        
-        self.split_anim.setStartValue(start_width)
-        self.split_anim.setEndValue(target_width)
-        
-        self.split_anim_max = QPropertyAnimation(self.right_container, b"maximumWidth")
-        self.split_anim_max.setDuration(500)
-        self.split_anim_max.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self.split_anim_max.setStartValue(start_width)
-        self.split_anim_max.setEndValue(target_width)
-        
-        self.group = QParallelAnimationGroup()
-        self.group.addAnimation(self.split_anim)
-        self.group.addAnimation(self.split_anim_max)
-        
+        if self.split_anim is None:
+            # Built on first use and reused; only the start/end widths change per call.
+            self.group = QParallelAnimationGroup(self)
+            self.split_anim = QPropertyAnimation(self.right_container, b"minimumWidth")
+            self.split_anim_max = QPropertyAnimation(self.right_container, b"maximumWidth")
+            for anim in (self.split_anim, self.split_anim_max):
+                anim.setDuration(500)
+                anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+                self.group.addAnimation(anim)
+
+        self.group.stop()
+        for anim in (self.split_anim, self.split_anim_max):
+            anim.setStartValue(start_width)
+            anim.setEndValue(target_width)
         self.group.start()
 
     # -----------------------------------------------------
     # Logic: Mode Selection
     # -----------------------------------------------------
-    def on_smt_checked(self, state):
-        """Keep mode checkboxes mutually exclusive and set All Results mode."""
-        if state == Qt.CheckState.Checked.value: 
-            self.cb_opt.blockSignals(True)
-            self.cb_opt.setChecked(False)
-            self.cb_opt.blockSignals(False)
-            self.mode_index = 0
-            self.toggle_weights_animation(False)
+    @pyqtSlot(int, bool)
+    def on_mode_toggled(self, mode_idx, checked):
+        """Switch the calculation mode when a mode checkbox becomes checked."""
+        if checked:
+            self._set_mode(mode_idx)
+
+    def _set_mode(self, mode_idx):
+        """Switch the calculation mode; repeated signals for the active mode are ignored."""
+        if mode_idx == self.mode_index:
+            return
+        self.mode_index = mode_idx
+        if mode_idx == 1 and self.card_weights is None:
+            self._build_weights_card()
+        self.toggle_weights_animation(mode_idx == 1)
+        if mode_idx == 0:
             self.btn_run.setText("Start Calculation (All Results)")
-            self.update_run_button_style(0)
-            self.notify_color_change("#107C10")
         else:
-            if not self.cb_opt.isChecked(): self.cb_smt.setChecked(True)
-
-    def on_opt_checked(self, state):
-        """Keep mode checkboxes mutually exclusive and set Weighted Sorted mode."""
-        if state == Qt.CheckState.Checked.value: 
-            self.cb_smt.blockSignals(True)
-            self.cb_smt.setChecked(False)
-            self.cb_smt.blockSignals(False)
-            self.mode_index = 1
-            self.toggle_weights_animation(True)
             self.btn_run.setText("Start Calculation (Weighted Sorted)")
-            self.update_run_button_style(1)
-            self.notify_color_change("#FF8C00")
-        else:
-            if not self.cb_smt.isChecked(): self.cb_opt.setChecked(True)
+        self.update_run_button_style(mode_idx)
+        self.notify_color_change(_COLOR_BY_MODE[mode_idx])
 
     def update_run_button_style(self, mode_idx):
         """Apply consistent theming to the primary run button based on mode."""
-        color_hex = "#107C10" if mode_idx == 0 else "#FF8C00"
-        btn_style = f"""
-            PrimaryPushButton {{ background-color: {color_hex}; border: 1px solid {color_hex}; border-radius: 6px; color: white; height: 40px; font-size: 16px; font-weight: bold; }}
-            PrimaryPushButton:hover {{ background-color: {color_hex}; border: 1px solid {color_hex}; }}
-            PrimaryPushButton:pressed {{ background-color: {color_hex}; opacity: 0.8; }}
-            PrimaryPushButton:disabled {{ background-color: {color_hex}; opacity: 0.5; border: 1px solid {color_hex}; color: rgba(255, 255, 255, 0.8); }}
-        """
-        self.btn_run.setStyleSheet(btn_style)
+        if mode_idx == self._run_style_mode:
+            return
+        self._run_style_mode = mode_idx
+        self.btn_run.setProperty("mode", _RUN_BUTTON_MODE[mode_idx])
+        style = self.btn_run.style()
+        style.unpolish(self.btn_run)
+        style.polish(self.btn_run)
 
     def notify_color_change(self, color_hex):
         """Propagate accent color changes to the results export button."""
         self.results_widget.set_export_button_color(color_hex)
 
-    def balance_weights(self, source_spin, new_val):
+    @pyqtSlot(float)
+    def _on_weight_changed(self, value):
+        """Shared valueChanged slot for the three weight spin boxes."""
+        self._schedule_balance(self._weight_spins.index(self.sender()), value)
+
+    def _schedule_balance(self, idx, new_val):
+        """Queue a rebalance so held arrow keys trigger one update per timer window."""
+        if self._pending_balance is not None and self._pending_balance[0] != idx:
+            # A different spin box was edited; settle the previous one first.
+            self._flush_pending_balance()
+        self._pending_balance = (idx, new_val)
+        self._balance_timer.start()
+
+    def _flush_pending_balance(self):
+        """Apply the latest queued weight edit, if any."""
+        self._balance_timer.stop()
+        pending = self._pending_balance
+        self._pending_balance = None
+        if pending is not None:
+            self.balance_weights(*pending)
+
+    def balance_weights(self, idx, new_val):
         """Adjust the other two weights evenly so the sum remains 1.0."""
-        old_val = self.prev_vals[source_spin]
-        delta = new_val - old_val
-        self.prev_vals[source_spin] = new_val
+        prev = self._prev_weights
+        delta = new_val - prev[idx]
+        prev[idx] = new_val
         if abs(delta) < 0.0001: return
-        others = [s for s in [self.spin_energy, self.spin_use, self.spin_co2] if s != source_spin]
-        for s in others: s.blockSignals(True)
         adjustment = delta / 2.0
-        for s in others:
-            curr = s.value()
-            s.setValue(max(0.0, min(1.0, curr - adjustment)))
-            self.prev_vals[s] = s.value()
-        for s in others: s.blockSignals(False)
+        others = [j for j in range(len(self._weight_spins)) if j != idx]
+        # Our own setValue calls must not schedule another rebalance
+        blockers = [QSignalBlocker(self._weight_spins[j]) for j in others]
+        try:
+            for j in others:
+                s = self._weight_spins[j]
+                curr = s.value()
+                new = max(0.0, min(1.0, curr - adjustment))
+                # Already pinned at 0.0/1.0: skip the redundant setValue and repaint
+                if abs(new - curr) > 1e-6:
+                    s.setValue(new)
+                    curr = s.value()
+                prev[j] = curr
+        finally:
+            for blocker in blockers: blocker.unblock()
 
     def get_weights(self):
         """Return the tuple of (energy, use, CO2) weights."""
-        return (self.spin_energy.value(), self.spin_use.value(), self.spin_co2.value())
+        if self.card_weights is None:
+            return _DEFAULT_WEIGHTS
+        self._flush_pending_balance()
+        return tuple(spin.value() for spin in self._weight_spins)
 
     def toggle_path_mode(self, checked):
         """Enable/disable custom export path selection."""
@@ -459,12 +648,36 @@ class HomePage(QWidget):
             self.lbl_exp_path.setText(self.current_export_path)
 
     def browse_path(self):
-        """Open a directory chooser for the export location."""
-        start_dir = self.current_export_path if os.path.exists(self.current_export_path) else os.getcwd()
-        d = self._open_directory_dialog("Select Export Directory", start_dir)
+        """Probe the current export path off the GUI thread, then open the directory chooser."""
+        if self._export_probe_pending:
+            return
+        path, exists, checked_at = self._export_path_exists_cache
+        if path == self.current_export_path and time.monotonic() - checked_at < _EXPORT_PROBE_TTL:
+            self._on_export_path_probed(path, exists)
+            return
+        self._export_probe_pending = True
+        probe = _PathProbeRunnable(self.current_export_path)
+        probe.signals.finished.connect(self._on_export_path_probed)
+        QThreadPool.globalInstance().start(probe)
+
+    def _on_export_path_probed(self, path, exists):
+        """Open the export directory chooser once the start directory has been checked."""
+        self._export_probe_pending = False
+        self._export_path_exists_cache = (path, exists, time.monotonic())
+        start_dir = path if exists else os.getcwd()
+        if self._export_dialog is None:
+            self._export_dialog = self._create_directory_dialog("Select Export Directory", start_dir)
+            self._export_dialog.fileSelected.connect(self._on_export_dir_selected)
+        else:
+            self._export_dialog.setDirectory(start_dir)
+        self._export_dialog.open()
+
+    def _on_export_dir_selected(self, d):
+        """Store the chosen export directory."""
         if d:
-            norm_d = os.path.normpath(d)
+            norm_d = _norm(d)
             self.current_export_path = norm_d
+            self._export_path_exists_cache = (norm_d, True, time.monotonic())
             self.lbl_exp_path.setText(norm_d)
 
     def get_export_path(self):
@@ -472,48 +685,86 @@ class HomePage(QWidget):
         return self.lbl_exp_path.text()
 
     def select_recipe(self):
-        """Prompt for a General Recipe XML file and update state."""
-        start_dir = self._program_dir()
-        f = self._open_file_dialog(
-            title="Select General Recipe XML",
-            start_dir=start_dir,
-            name_filter="XML Files (*.xml);;All Files (*)",
-        )
+        """Prompt for a General Recipe XML file; the result arrives in _on_recipe_selected."""
+        # Reuse one dialog so its directory model is not rebuilt on every open.
+        if self._recipe_dialog is None:
+            self._recipe_dialog = self._create_file_dialog(
+                title="Select General Recipe XML",
+                start_dir=self._program_dir(),
+                name_filter="XML Files (*.xml);;All Files (*)",
+            )
+            self._recipe_dialog.fileSelected.connect(self._on_recipe_selected)
+        self._recipe_dialog.open()
+
+    def _on_recipe_selected(self, f):
+        """Store the chosen General Recipe XML and update state."""
         if f:
-            self.recipe_path = os.path.normpath(f)
+            self.recipe_path = _norm(f)
             self.lbl_recipe_val.setText(os.path.basename(self.recipe_path))
-            self.check_ready()
+            self._refresh_run_enabled()
 
     def select_folder(self):
-        """Prompt for the resources directory and update state."""
-        start_dir = self._program_dir()
-        d = self._open_directory_dialog("Select Resources Folder (XML/AASX/JSON)", start_dir)
+        """Prompt for the resources directory; the result arrives in _on_folder_selected."""
+        if self._folder_dialog is None:
+            self._folder_dialog = self._create_directory_dialog(
+                "Select Resources Folder (XML/AASX/JSON)",
+                self._program_dir(),
+            )
+            self._folder_dialog.fileSelected.connect(self._on_folder_selected)
+        self._folder_dialog.open()
 
+    def _on_folder_selected(self, d):
+        """Store the chosen resources directory and start scanning it."""
         if d:
-            self.resource_dir = os.path.normpath(d)
+            self.resource_dir = _norm(d)
             self.lbl_res_val.setText(self.resource_dir)
-            self.check_ready()
-
-    def check_ready(self):
-        """Enable Run only when both recipe and resources are selected."""
-        if self.recipe_path and self.resource_dir:
-            self.btn_run.setEnabled(True)
+            self.resource_file_count = None
+            self._refresh_run_enabled()
+            scan = _ResourceScanRunnable(self.resource_dir)
+            scan.signals.finished.connect(self._on_resource_scan_finished)
+            QThreadPool.globalInstance().start(scan)
+
+    def _on_resource_scan_finished(self, resource_dir, count):
+        """Record the background scan result for the currently selected resources folder."""
+        if resource_dir != self.resource_dir:
+            return  # A newer folder was selected meanwhile
+        self.resource_file_count = count
+        if count <= 0:
+            InfoBar.warning(
+                title="No Resource Files",
+                content="Selected folder does not contain any readable .xml, .aasx, or .json files.",
+                parent=self,
+                position=InfoBarPosition.TOP_RIGHT,
+            )
+        self._refresh_run_enabled()
 
-    def is_worker_running(self) -> bool:
-        """Return whether a calculation thread is currently active."""
-        return bool(self.worker is not None and self.worker.isRunning())
+    def _refresh_run_enabled(self):
+        """Enable Run exactly when both recipe and a non-empty resources folder are selected."""
+        self.btn_run.setEnabled(
+            bool(self.recipe_path and self.resource_dir and (self.resource_file_count or 0) > 0)
+        )
 
-    def _cleanup_worker_reference(self):
-        """Release the completed worker safely after the thread finishes."""
-        finished_worker = self.sender()
-        if finished_worker is not None and hasattr(finished_worker, "deleteLater"):
-            finished_worker.deleteLater()
+    def _window_hooks(self):
+        """Resolve the main window's log/validator page callbacks once and reuse them."""
+        if self._hooks is None:
+            main = self.window()
+            if main is self:
+                return {}  # Not embedded in the main window yet; try again next time
+            log_page = getattr(main, "log_page", None)
+            validator_page = getattr(main, "recipe_validator_page", None)
+            self._hooks = {
+                "log_reset": getattr(log_page, "reset_for_run", None),
+                "log_context": getattr(log_page, "set_context_data", None),
+                "validator_context": getattr(validator_page, "set_context_data", None),
+            }
+        return self._hooks
 
-        if finished_worker is self.worker:
-            self.worker = None
+    def is_worker_running(self) -> bool:
+        """Return whether a calculation task is currently active."""
+        return self._worker_active
 
     def run_process(self):
-        """Instantiate the worker thread and kick off result calculation processing."""
+        """Queue a calculation task on the shared thread pool and kick off result processing."""
         if self.is_worker_running():
             InfoBar.warning(
                 title="Calculation Running",
@@ -524,48 +775,133 @@ class HomePage(QWidget):
             return
 
         self.btn_run.setEnabled(False)
-        main = self.window()
-        if hasattr(main, "log_page") and hasattr(main.log_page, "reset_for_run"):
+        reset_for_run = self._window_hooks().get("log_reset")
+        if reset_for_run is not None:
             try:
-                main.log_page.reset_for_run(self.recipe_path, self.resource_dir)
+                reset_for_run(self.recipe_path, self.resource_dir)
             except Exception:
                 pass
         self.log_callback("Starting Process...")
         weights = self.get_weights()
-        self.worker = SMTWorker(self.recipe_path, self.resource_dir, self.mode_index, weights)
-        self.worker.log_signal.connect(self.log_callback)
-        self.worker.progress_signal.connect(lambda c, t: (self.pbar.setMaximum(t), self.pbar.setValue(c)))
-        self.worker.error_signal.connect(self.handle_error)
-        self.worker.finished_signal.connect(self.on_finished)
-        self.worker.finished.connect(self._cleanup_worker_reference)
-        self.worker.start()
-
+        # Imported here so the solver/parser stack is not loaded before the first paint.
+        from Code.GUI.Workers import SMTWorker, SMTWorkerSignals
+        if self._worker_signals is None:
+            # One signals holder is shared by every run; GUI connections are wired once.
+            self._worker_signals = SMTWorkerSignals(self)
+            queued = Qt.ConnectionType.QueuedConnection
+            self._worker_signals.log_signal.connect(self.log_callback, queued)
+            self._worker_signals.total_signal.connect(self.pbar.setMaximum, queued)
+            self._worker_signals.progress_signal.connect(self._on_progress, queued)
+            self._worker_signals.error_signal.connect(self.handle_error, queued)
+            self._worker_signals.finished_signal.connect(self.on_finished, queued)
+            self._worker_signals.partial_signal.connect(self._on_partial_results, queued)
+        worker = SMTWorker(self._worker_signals, self.recipe_path, self.resource_dir, self.mode_index, weights)
+        self._worker_active = True
+        self._streamed_results = False
+        QThreadPool.globalInstance().start(worker)
+
+    @pyqtSlot(int)
+    def _on_progress(self, current):
+        """Remember the latest progress value; the bar is updated by _flush_progress."""
+        self._pending_progress = current
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        """Apply the most recent progress value to the bar if it changed."""
+        self._progress_timer.stop()
+        current, self._pending_progress = self._pending_progress, None
+        if current is not None and current != self.pbar.value():
+            self.pbar.setValue(current)
+
+    @pyqtSlot(list)
+    def _on_partial_results(self, rows):
+        """Show rows as the solver finds them; the first batch opens the results panel."""
+        if not self._streamed_results:
+            self._streamed_results = True
+            self.results_widget.begin_stream()
+            self.toggle_results_panel(True)
+        self.results_widget.append_rows(rows)
+
+    @pyqtSlot(list, dict)
     def on_finished(self, results, context_data):
         """Handle successful completion: re-enable UI, notify, and show results."""
-        self.btn_run.setEnabled(True)
-        InfoBar.success(title="Completed", content=f"Calculation finished.", parent=self, position=InfoBarPosition.TOP_RIGHT)
-        self.results_widget.set_data(results, context_data)
-        main = self.window()
-        if hasattr(main, "log_page") and hasattr(main.log_page, "set_context_data"):
+        self._worker_active = False
+        self._flush_progress()
+        self._refresh_run_enabled()
+        self._show_run_info(InfoBar.success, "Completed", "Calculation finished.")
+        if self._streamed_results:
+            self.results_widget.finish_stream(results, context_data)
+        else:
+            self.results_widget.set_data(results, context_data)
+        hooks = self._window_hooks()
+        if hooks.get("log_context") is not None:
             try:
-                main.log_page.set_context_data(context_data)
+                hooks["log_context"](context_data)
             except Exception as exc:
                 self.log_callback(f"Warning: failed to update log page: {exc}")
-        if hasattr(main, "recipe_validator_page") and hasattr(main.recipe_validator_page, "set_context_data"):
-            main.recipe_validator_page.set_context_data(context_data)
+        if hooks.get("validator_context") is not None:
+            hooks["validator_context"](context_data)
         self.toggle_results_panel(True)
 
+    @pyqtSlot(str)
     def handle_error(self, err_msg):
         """
         Show error InfoBar and reset UI so user can retry without restarting the app.
         """
+        self._worker_active = False
+        self._progress_timer.stop()
+        self._pending_progress = None
         self.pbar.setMaximum(100)
         self.pbar.setValue(0)
-        self.btn_run.setEnabled(True)
-        InfoBar.error(title="Error", content=err_msg, parent=self, position=InfoBarPosition.TOP_RIGHT)
+        self._refresh_run_enabled()
+        if self._streamed_results:
+            # Rows from a failed run have no export context; don't leave them looking usable
+            self._streamed_results = False
+            self.results_widget.abort_stream()
+        if self._err_timer.isActive():
+            # Shown once the burst window closes; identical messages are listed once
+            if err_msg not in self._err_queue:
+                self._err_queue.append(err_msg)
+            return
+        self._show_run_info(InfoBar.error, "Error", err_msg)
+        self._err_timer.start()
+
+    def _flush_errors(self):
+        """Show the errors collected during the last burst window as a single InfoBar."""
+        if not self._err_queue:
+            return
+        content = "\n".join(self._err_queue)
+        self._err_queue = []
+        self._show_run_info(InfoBar.error, "Error", content)
+        self._err_timer.start()
+
+    def changeEvent(self, event):
+        """Font or style changes alter the weights card's size hint; re-measure it."""
+        if event.type() in (QEvent.Type.FontChange, QEvent.Type.StyleChange):
+            self._weights_target_h = 0
+        super().changeEvent(event)
+
+    def _show_run_info(self, show, title, content):
+        """Show a run outcome InfoBar unless the same one is still on screen."""
+        if self._run_info is not None:
+            last_show, last_content, bar = self._run_info
+            try:
+                still_shown = bar is not None and bar.isVisible()
+            except RuntimeError:
+                still_shown = False  # Closed and deleted by Qt
+            if still_shown and last_show is show and last_content == content:
+                return
+        bar = show(title=title, content=content, parent=self, position=InfoBarPosition.TOP_RIGHT)
+        self._run_info = (show, content, bar)
 
     def resizeEvent(self, event):
         """Keep the split layout responsive when the window size changes."""
         if self.right_container.width() > 0:
-             self.right_container.setFixedWidth(self.width() // 2)
+            self._resize_timer.start()
         super().resizeEvent(event)
+
+    def _apply_right_width(self):
+        """Give the open results panel half of the page width."""
+        if self.right_container.width() > 0:
+            self.right_container.setFixedWidth(self.width() // 2)
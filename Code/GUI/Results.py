@@ -1,42 +1,332 @@
 # Code/GUI/Results.py
+import copy
 import os
 import sys
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Dict, Optional
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, pyqtSignal
+)
 from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
-    QTableWidgetItem,
     QHeaderView,
     QHBoxLayout,
     QFileDialog,
+    QStyle,
 )
 
 from qfluentwidgets import (
-    TableWidget,
+    TableView,
     SubtitleLabel,
     PushButton,
     InfoBarPosition,
-    CheckBox,
 )
 from Code.GUI.Notifications import SafeInfoBar as InfoBar
 
-# Import Generator
-from Code.Transformator.MasterRecipeGenerator import generate_b2mml_master_recipe
+# The Master Recipe generator, the validators (lxml) and the AAS parser are imported where
+# they are first used, so opening the GUI does not pay for them until Export/Validate is clicked.
+
+
+_SCORE_HEADERS = ["", "Sol ID", "Step", "Resource", "Capabilities", "Weighted Energy", "Weighted Use", "Weighted CO2"]
+_PLAIN_HEADERS = ["", "Sol ID", "Step", "Description", "Resource", "Capabilities", "Status"]
+_STATUS_COLOR = QColor("#28a745")
+
+
+@lru_cache(maxsize=512)
+def _wrap_capability_string(text: str) -> str:
+    # Steps of different solutions often share the same capability string
+    return text.replace(", ", ",\n") if ", " in text else text
+
+
+def _format_capabilities_text(raw_capabilities) -> str:
+    """Format capabilities for readable full display in table cells."""
+    if isinstance(raw_capabilities, str):
+        return _wrap_capability_string(raw_capabilities)
+    if isinstance(raw_capabilities, (list, tuple, set)):
+        return "\n".join(map(str, raw_capabilities))
+    if raw_capabilities is None:
+        return ""
+    return _wrap_capability_string(str(raw_capabilities))
+
+
+def _export_id(solution_id) -> Optional[int]:
+    """Return the solution id as an int if it can be exported, else None."""
+    text = str(solution_id)
+    return int(text) if text.isdigit() else None
+
+
+_FMT1 = "{:.1f}".format
+_FMT2 = "{:.2f}".format
+
+
+def _blank(row_data: Dict) -> str:
+    return ""
+
+
+def _score_summary(row_data: Dict) -> str:
+    return f"Solution {row_data['solution_id']}, Total Weighted Cost = {_FMT2(row_data['composite_score'])}"
 
-# Validation helpers
-from Code.Transformator.MasterRecipeValidator import (
-    validate_master_recipe_xml,
-    validate_master_recipe_parameters,
+
+def _score_header_sol_id(row_data: Dict) -> str:
+    return str(row_data["solution_id"])
+
+
+def _as_text(value) -> str:
+    # Pipeline text fields are already str; only convert the odd non-str value
+    return value if isinstance(value, str) else str(value)
+
+
+# Per-column text getters, indexed by column; resolved once per table instead of per cell.
+# Keys read with [] are always set by run_optimization() / SMTWorker for that row kind.
+# Rows are never modified here: streamed dicts are still owned by the worker.
+_PLAIN_COLUMNS = (
+    _blank,
+    lambda r: str(r["solution_id"]),
+    lambda r: _as_text(r["step_id"]),
+    lambda r: _as_text(r["description"]),
+    lambda r: _as_text(r["resource"]),
+    lambda r: _format_capabilities_text(r["capabilities"]),
+    lambda r: _as_text(r["status"]),
+)
+_SCORE_COLUMNS = (
+    _blank,
+    _blank,
+    lambda r: _as_text(r["step_id"]),
+    lambda r: _as_text(r["resource"]),
+    lambda r: _format_capabilities_text(r["capabilities"]),
+    lambda r: _FMT1(r["energy_cost"]),
+    lambda r: _FMT1(r["use_cost"]),
+    lambda r: _FMT1(r["co2_footprint"]),
 )
+_SCORE_HEADER_COLUMNS = (_blank, _score_header_sol_id, _score_summary) + (_blank,) * 5
+
+
+# Enum members resolved once; data()/flags() run for every visible cell on each repaint.
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_CHECK_ROLE = Qt.ItemDataRole.CheckStateRole
+_FOREGROUND_ROLE = Qt.ItemDataRole.ForegroundRole
+_CHECKED = Qt.CheckState.Checked
+_UNCHECKED = Qt.CheckState.Unchecked
+_NO_FLAGS = Qt.ItemFlag.NoItemFlags
+_ENABLED = Qt.ItemFlag.ItemIsEnabled
+_CHECKABLE = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+
+
+class _ExportSignals(QObject):
+    """Signals for _ExportRunnable; QRunnable itself cannot emit."""
+    finished = pyqtSignal(int, str)  # (exported file count, directory written to)
+    failed = pyqtSignal(str)
+
+
+class _ExportRunnable(QRunnable):
+    """Write the Master Recipe XML for each selected solution off the GUI thread."""
+
+    def __init__(self, context_data: Dict, solution_ids: List[int], save_dir: str, fallback_dir: str):
+        super().__init__()
+        self.signals = _ExportSignals()
+        # The generator writes into the recipe's ProcessElements; copy on the GUI thread so the
+        # pool thread never mutates dicts the log page and validators still hold.
+        self.recipe = copy.deepcopy(context_data["recipe"])
+        self.resources = copy.deepcopy(context_data["resources"])
+        self.solutions = context_data["solutions"]
+        self.solution_ids = solution_ids
+        self.save_dir = save_dir
+        self.fallback_dir = fallback_dir
+
+    def run(self):
+        save_dir = self.save_dir
+        try:
+            os.makedirs(save_dir, exist_ok=True)
+        except OSError:
+            save_dir = self.fallback_dir
+
+        success_count = 0
+        try:
+            from Code.Transformator.MasterRecipeGenerator import generate_b2mml_master_recipe
+            for sol_id in self.solution_ids:
+                filename = f"MasterRecipe_Sol_{sol_id}.xml"
+                full_path = os.path.join(save_dir, filename)
+                generate_b2mml_master_recipe(
+                    resources_data=self.resources,
+                    solutions_data_list=self.solutions,
+                    general_recipe_data=self.recipe,
+                    selected_solution_id=sol_id,
+                    output_path=full_path,
+                )
+                success_count += 1
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(success_count, save_dir)
 
-# For on-demand parsing if no cached resources exist
-try:
-    from Code.SMT4ModPlant.AASxmlCapabilityParser import parse_capabilities_robust
-except Exception:
-    parse_capabilities_robust = None
+
+class ResultsTableModel(QAbstractTableModel):
+    """Read-only view over the worker's result rows; cell text is produced on demand."""
+
+    checkedChanged = pyqtSignal(int)  # number of checked solutions
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Dict] = []
+        self._has_score = False
+        self._headers: List[str] = []
+        self._checkable: Dict[int, Optional[int]] = {}  # checkbox row -> exportable solution id (None if not numeric)
+        self._checked = set()
+        self._summary_rows: List[int] = []
+        self._last_sol_id = -1
+        self._columns = _PLAIN_COLUMNS
+        self._text: Dict[int, tuple] = {}  # row -> formatted cell strings, filled on first paint
+
+    def set_rows(self, data: List[Dict]):
+        """Replace the displayed rows; checkbox and summary rows are resolved once here."""
+        self.beginResetModel()
+        self._rows = data or []
+        # Score mode tags every non-separator row, so the first one decides; no full scan needed.
+        self._has_score = next(("composite_score" in r for r in self._rows if r), False)
+        if not self._rows:
+            self._headers = []
+        else:
+            self._headers = _SCORE_HEADERS if self._has_score else _PLAIN_HEADERS
+        self._columns = _SCORE_COLUMNS if self._has_score else _PLAIN_COLUMNS
+        self._checkable = {}
+        self._checked = set()
+        self._summary_rows = []
+        self._last_sol_id = -1
+        self._text = {}
+        self._index_rows(0)
+        self.endResetModel()
+        self.checkedChanged.emit(0)
+
+    def append_rows(self, rows: List[Dict]):
+        """Append rows streamed in during a calculation without resetting the model."""
+        if not rows:
+            return
+        if not self._rows:
+            self.set_rows(list(rows))
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._index_rows(first)
+        self.endInsertRows()
+
+    def _index_rows(self, start: int):
+        """Record summary and checkable rows from `start` onwards."""
+        last_sol_id = self._last_sol_id
+        for r in range(start, len(self._rows)):
+            row_data = self._rows[r]
+            if not row_data:
+                continue
+            current_sol_id = row_data.get("solution_id", -1)
+            if self._has_score:
+                if row_data.get("is_solution_header"):
+                    # Checkbox and export ID are on the solution header row.
+                    self._summary_rows.append(r)
+                    if current_sol_id != -1:
+                        self._checkable[r] = _export_id(current_sol_id)
+            elif current_sol_id != last_sol_id and current_sol_id != -1:
+                # Only the first row of each solution is selectable.
+                self._checkable[r] = _export_id(current_sol_id)
+                last_sol_id = current_sol_id
+        self._last_sol_id = last_sol_id
+
+    def rows(self) -> List[Dict]:
+        return self._rows
+
+    def has_score(self) -> bool:
+        return self._has_score
+
+    def summary_rows(self) -> List[int]:
+        """Rows whose summary text spans from column 2 to the end."""
+        return self._summary_rows
+
+    def capabilities_text(self, r: int) -> str:
+        """Formatted capabilities of row `r` ("" for separators and solution headers)."""
+        row_data = self._rows[r]
+        if not row_data or row_data.get("is_solution_header"):
+            return ""
+        return _format_capabilities_text(row_data["capabilities"])
+
+    def line_count(self, r: int) -> int:
+        """Number of text lines in row `r` (0 for separators); capabilities are the only multi-line cell."""
+        if not self._rows[r]:
+            return 0
+        # Only the capabilities cell is formatted here; the rest of the row stays lazy until painted
+        return self.capabilities_text(r).count("\n") + 1
+
+    def _row_text(self, r: int) -> tuple:
+        """All display strings of row `r`, formatted in one pass and reused on later repaints."""
+        text = self._text.get(r)
+        if text is None:
+            row_data = self._rows[r]
+            if self._has_score and row_data.get("is_solution_header"):
+                columns = _SCORE_HEADER_COLUMNS
+            else:
+                columns = self._columns
+            text = self._text[r] = tuple(get(row_data) for get in columns)
+        return text
+
+    def checked_count(self) -> int:
+        return len(self._checked)
+
+    def checked_solution_ids(self) -> List[int]:
+        """Numeric solution ids of the checked rows, validated once when the rows were loaded."""
+        ids = (self._checkable[r] for r in sorted(self._checked))
+        return [sol_id for sol_id in ids if sol_id is not None]
+
+    # -- QAbstractTableModel interface --
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=_DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE and orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < len(self._headers):
+                return self._headers[section]
+        return None
+
+    def flags(self, index):
+        r, c = index.row(), index.column()
+        if not self._rows[r]:
+            return _NO_FLAGS  # separator row
+        if c == 0:
+            return _CHECKABLE if r in self._checkable else _NO_FLAGS
+        return _ENABLED
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+        r, c = index.row(), index.column()
+        row_data = self._rows[r]
+        if not row_data:
+            return None
+        if role == _DISPLAY_ROLE:
+            return self._row_text(r)[c]
+        if role == _CHECK_ROLE and c == 0 and r in self._checkable:
+            return _CHECKED if r in self._checked else _UNCHECKED
+        if role == _FOREGROUND_ROLE and c == 6 and not self._has_score:
+            return _STATUS_COLOR
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        r = index.row()
+        if role != _CHECK_ROLE or index.column() != 0 or r not in self._checkable:
+            return False
+        if Qt.CheckState(value) == _CHECKED:
+            self._checked.add(r)
+        else:
+            self._checked.discard(r)
+        self.dataChanged.emit(index, index, [role])
+        self.checkedChanged.emit(len(self._checked))
+        return True
 
 
 class ResultsWidget(QWidget):
@@ -46,6 +336,10 @@ class ResultsWidget(QWidget):
 
         # Store context data for export + parameter validation
         self.context_data: Optional[Dict] = None
+        self._exporting = False
+        self._streaming = False  # rows shown, but no export context until finish_stream
+        # (xml path, mtime_ns, size, id(resources)) -> (resources, result); cleared with context_data
+        self._param_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 0, 0, 0)
@@ -62,13 +356,22 @@ class ResultsWidget(QWidget):
         header_layout.addStretch(1)
         header_layout.addWidget(self.btn_export)
 
-        self.table = TableWidget(self)
+        self.model = ResultsTableModel(self)
+        self.model.checkedChanged.connect(self._update_export_button_state)
+
+        self.table = TableView(self)
+        self.table.setModel(self.model)
         self.table.verticalHeader().setVisible(False)
         self.table.setBorderVisible(True)
-        self.table.setWordWrap(True)
+        # Capabilities keep their explicit line breaks only: a line wider than the fitted column
+        # elides instead of soft-wrapping into lines the line-count row heights would clip.
+        self.table.setWordWrap(False)
 
-        self.table.setSelectionMode(TableWidget.SelectionMode.NoSelection)
-        self.table.itemChanged.connect(self.on_item_changed)
+        self.table.setSelectionMode(TableView.SelectionMode.NoSelection)
+        # Column fitting samples the first rows only instead of measuring every row's text
+        self.table.horizontalHeader().setResizeContentsPrecision(50)
+        # Row heights come from _apply_row_heights; Qt never measures rows on its own
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
 
         layout.addLayout(header_layout)
         layout.addWidget(self.table, 1)
@@ -158,31 +461,67 @@ class ResultsWidget(QWidget):
     # -------------------------
     def set_data(self, gui_data: List[Dict], context_data: Dict):
         """Called by Home to show results and cache context for export/validation."""
+        if context_data is not self.context_data:
+            self._param_cache.clear()
         self.context_data = context_data
+        current = self.model.rows()
+        if gui_data and len(gui_data) == len(current) and gui_data == current:
+            return  # Same rows already shown; keep the table and the user's selection
         self.update_table(gui_data)
         self.btn_export.setEnabled(False)
         self.btn_export.setText("Export Selected")
 
-    def on_item_changed(self, item: QTableWidgetItem):
-        """Keep export button state in sync when item-based checkbox changes."""
-        if item.column() != 0:
-            return
-        self._update_export_button_state()
-
-    def _row_is_checked(self, row: int) -> bool:
-        cb = self.table.cellWidget(row, 0)
-        if isinstance(cb, CheckBox):
-            return cb.isChecked()
-        chk_item = self.table.item(row, 0)
-        return bool(chk_item and chk_item.checkState() == Qt.CheckState.Checked)
-
-    def _update_export_button_state(self):
-        checked_count = 0
-        for r in range(self.table.rowCount()):
-            if self._row_is_checked(r):
-                checked_count += 1
+    def begin_stream(self):
+        """Clear the table before rows start arriving from a running calculation."""
+        self._streaming = True
+        self.context_data = None
+        self._param_cache.clear()
+        self.update_table([])
+
+    def abort_stream(self):
+        """Drop rows streamed by a run that failed before delivering its context."""
+        self._streaming = False
+        self.context_data = None
+        self._param_cache.clear()
+        self.update_table([])
+        self.btn_export.setEnabled(False)
+        self.btn_export.setText("Export Selected")
 
-        self.btn_export.setEnabled(checked_count > 0)
+    def append_rows(self, rows: List[Dict]):
+        """Show rows streamed in by the worker while it is still searching."""
+        first = self.model.rowCount()
+        self.model.append_rows(rows)
+        if first == 0:
+            self._fit_columns()
+        else:
+            self._fit_capabilities_column(first)
+        self._apply_row_heights(first)
+
+    def finish_stream(self, gui_data: List[Dict], context_data: Dict):
+        """Attach the final context; rebuild only if the final rows differ from those streamed."""
+        self._streaming = False
+        current = self.model.rows()
+        # Final rows are normally the very dicts that were streamed, so this is mostly identity checks
+        if len(gui_data) != len(current) or gui_data != current:
+            self.set_data(gui_data, context_data)
+            return
+        self._param_cache.clear()
+        self.context_data = context_data
+        # Refit from the final sample, but keep any width the streamed batches grew the column to
+        cap_col = self._capabilities_column()
+        streamed_width = self.table.columnWidth(cap_col)
+        self._fit_columns()
+        if streamed_width > self.table.columnWidth(cap_col):
+            self.table.setColumnWidth(cap_col, streamed_width)
+        self._update_export_button_state()  # Rows checked while streaming become exportable now
+
+    def _update_export_button_state(self, checked_count: Optional[int] = None):
+        if self._exporting:
+            return  # Restored when the running export reports back
+        if checked_count is None:
+            checked_count = self.model.checked_count()
+        # Streamed rows can be checked, but there is nothing to export until the context arrives
+        self.btn_export.setEnabled(checked_count > 0 and not self._streaming)
         if checked_count > 0:
             self.btn_export.setText(f"Export ({checked_count})")
         else:
@@ -195,58 +534,46 @@ class ResultsWidget(QWidget):
         if not isinstance(self.context_data, dict):
             return
 
-        selected_sol_ids = set()
-        for r in range(self.table.rowCount()):
-            if self._row_is_checked(r):
-                sol_id_item = self.table.item(r, 1)
-                if sol_id_item and (sol_id_item.text() or "").isdigit():
-                    selected_sol_ids.add(int(sol_id_item.text()))
+        selected_sol_ids = set(self.model.checked_solution_ids())
 
         if not selected_sol_ids:
             return
 
         save_dir = self._get_preferred_export_dir()
 
-        if not os.path.exists(save_dir):
-            try:
-                os.makedirs(save_dir)
-            except Exception:
-                save_dir = self._default_user_dir()
-
-        success_count = 0
-        try:
-            for sol_id in selected_sol_ids:
-                filename = f"MasterRecipe_Sol_{sol_id}.xml"
-                full_path = os.path.join(save_dir, filename)
-                generate_b2mml_master_recipe(
-                    resources_data=self.context_data["resources"],
-                    solutions_data_list=self.context_data["solutions"],
-                    general_recipe_data=self.context_data["recipe"],
-                    selected_solution_id=sol_id,
-                    output_path=full_path,
-                )
-                success_count += 1
+        # Write the files on the thread pool so the window stays responsive.
+        self._exporting = True
+        self.btn_export.setEnabled(False)
+        self.btn_export.setText("Exporting...")
+        job = _ExportRunnable(self.context_data, sorted(selected_sol_ids), save_dir, self._default_user_dir())
+        job.signals.finished.connect(self._on_export_finished)
+        job.signals.failed.connect(self._on_export_failed)
+        QThreadPool.globalInstance().start(job)
+
+    def _on_export_finished(self, success_count: int, save_dir: str):
+        self._exporting = False
+        self._update_export_button_state()
+        InfoBar.success(
+            title="Export Successful",
+            content=f"Successfully exported {success_count} recipe(s) to {save_dir}",
+            orient=Qt.Orientation.Horizontal,
+            isClosable=True,
+            position=InfoBarPosition.TOP_RIGHT,
+            duration=5000,
+            parent=self.window(),
+        )
 
-            InfoBar.success(
-                title="Export Successful",
-                content=f"Successfully exported {success_count} recipe(s) to {save_dir}",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP_RIGHT,
-                duration=5000,
-                parent=self.window(),
-            )
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            InfoBar.error(
-                title="Export Failed",
-                content=str(e),
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP_RIGHT,
-                parent=self.window(),
-            )
+    def _on_export_failed(self, message: str):
+        self._exporting = False
+        self._update_export_button_state()
+        InfoBar.error(
+            title="Export Failed",
+            content=message,
+            orient=Qt.Orientation.Horizontal,
+            isClosable=True,
+            position=InfoBarPosition.TOP_RIGHT,
+            parent=self.window(),
+        )
 
     # -------------------------
     # Logging helper
@@ -295,6 +622,7 @@ class ResultsWidget(QWidget):
             return
 
         try:
+            from Code.Transformator.MasterRecipeValidator import validate_master_recipe_xml
             ok, errors, used_root = validate_master_recipe_xml(xml_path, schema_dir, root_xsd_path=None)
 
             self._append_log(f"[VALIDATION] XML: {xml_path}")
@@ -374,7 +702,10 @@ class ResultsWidget(QWidget):
 
         # If cached resources are missing/invalid, parse on-demand
         if not _has_usable_resources(resources_data):
-            if parse_capabilities_robust is None:
+            try:
+                # For on-demand parsing if no cached resources exist
+                from Code.SMT4ModPlant.AASxmlCapabilityParser import parse_capabilities_robust
+            except Exception:
                 InfoBar.error(
                     title="Parameter Validation Error",
                     content="AAS parser (parse_capabilities_robust) not available in this build.",
@@ -391,7 +722,12 @@ class ResultsWidget(QWidget):
             )
             if not resource_dir:
                 return
-            if not any(name.lower().endswith((".xml", ".aasx", ".json")) for name in os.listdir(resource_dir)):
+            with os.scandir(resource_dir) as it:
+                entries = [
+                    (entry.path, entry.name) for entry in it
+                    if entry.name.lower().endswith((".xml", ".aasx", ".json"))
+                ]
+            if not entries:
                 InfoBar.error(
                     title="Parameter Validation Error",
                     content="Selected folder does not contain any .xml, .aasx, or .json files.",
@@ -406,11 +742,8 @@ class ResultsWidget(QWidget):
             self._append_log(f"[PARAM-VALIDATION] Parsing resources from: {resource_dir}")
             resources_data = {}
             try:
-                for fn in os.listdir(resource_dir):
-                    if not fn.lower().endswith((".xml", ".aasx", ".json")):
-                        continue
-                    full = os.path.join(resource_dir, fn)
-                    res_name = os.path.splitext(fn)[0]
+                for full, fn in entries:
+                    res_name = fn.rsplit(".", 1)[0]
                     try:
                         caps = parse_capabilities_robust(full)
                         if caps:
@@ -440,26 +773,35 @@ class ResultsWidget(QWidget):
                 return
 
         try:
-            ok, errors, warnings, checked, details = validate_master_recipe_parameters(xml_path, resources_data)
-
-            self._append_log(f"[PARAM-VALIDATION] XML: {xml_path}")
-            self._append_log(f"[PARAM-VALIDATION] Checked parameters: {checked}")
-
-            found_items = [d for d in details if d.get("status") == "FOUND"]
-            missing_items = [d for d in details if d.get("status") == "MISSING"]
-            self._append_log(f"[PARAM-VALIDATION] Matched: {len(found_items)} | Missing: {len(missing_items)}")
+            ok, errors, warnings, checked, details = self._validate_parameters_cached(xml_path, resources_data)
+
+            # Collected and written to the log page in one append instead of up to ~350
+            lines = [
+                f"[PARAM-VALIDATION] XML: {xml_path}",
+                f"[PARAM-VALIDATION] Checked parameters: {checked}",
+            ]
+
+            found_items = []
+            missing_count = 0
+            for d in details:
+                status = d.get("status")
+                if status == "FOUND":
+                    found_items.append(d)
+                elif status == "MISSING":
+                    missing_count += 1
+            lines.append(f"[PARAM-VALIDATION] Matched: {len(found_items)} | Missing: {missing_count}")
 
             for d in found_items[:50]:
-                self._append_log(
-                    f"  OK: {d.get('description')} -> id={d.get('raw_id') or d.get('uuid')} (uuid={d.get('uuid')}) "
+                uuid = d.get("uuid")
+                lines.append(
+                    f"  OK: {d.get('description')} -> id={d.get('raw_id') or uuid} (uuid={uuid}) "
                     f"in {d.get('resource_key')} / {d.get('capability_name')} / {d.get('property_name')} "
                     f"({d.get('property_unit')})"
                 )
 
-            for w in warnings[:100]:
-                self._append_log(f"  WARN: {w}")
-            for e in errors[:200]:
-                self._append_log(f"  ERROR: {e}")
+            lines.extend(f"  WARN: {w}" for w in warnings[:100])
+            lines.extend(f"  ERROR: {e}" for e in errors[:200])
+            self._append_log("\n".join(lines))
 
             if ok:
                 InfoBar.success(
@@ -498,114 +840,83 @@ class ResultsWidget(QWidget):
                 parent=self.window(),
             )
 
+    def _validate_parameters_cached(self, xml_path: str, resources_data: Dict):
+        """Reuse the last result while neither the XML file nor the resources object changed."""
+        st = os.stat(xml_path)
+        key = (xml_path, st.st_mtime_ns, st.st_size, id(resources_data))
+        hit = self._param_cache.get(key)
+        if hit is not None:
+            self._param_cache.move_to_end(key)
+            return hit[1]
+        from Code.Transformator.MasterRecipeValidator import validate_master_recipe_parameters
+        result = validate_master_recipe_parameters(xml_path, resources_data)
+        # Keep resources_data referenced so its id() cannot be reused by another dict
+        self._param_cache[key] = (resources_data, result)
+        if len(self._param_cache) > 8:
+            self._param_cache.popitem(last=False)
+        return result
+
     # -------------------------
     # Table rendering (kept compatible with existing columns)
     # -------------------------
-    def _format_capabilities_text(self, raw_capabilities) -> str:
-        """Format capabilities for readable full display in table cells."""
-        if isinstance(raw_capabilities, (list, tuple, set)):
-            return "\n".join(str(x) for x in raw_capabilities)
-        text = str(raw_capabilities) if raw_capabilities is not None else ""
-        if ", " in text:
-            return text.replace(", ", ",\n")
-        return text
-
     def update_table(self, data: List[Dict]):
         """Update results table. Adds a leading checkbox column."""
-        if not data:
-            self.table.setRowCount(0)
-            self.table.setColumnCount(0)
-            return
-
-        # detect score mode
-        has_score = any(isinstance(r, dict) and "composite_score" in r for r in data if r)
-
-        # headers/columns (checkbox + previous layout)
-        if has_score:
-            headers = ["", "Sol ID", "Step", "Resource", "Capabilities", "Weighted Energy", "Weighted Use", "Weighted CO2"]
-            self.table.setColumnCount(8)
-        else:
-            headers = ["", "Sol ID", "Step", "Description", "Resource", "Capabilities", "Status"]
-            self.table.setColumnCount(7)
-
-        self.table.setSortingEnabled(False)
-        self.table.blockSignals(True)
-        self.table.clearContents()
-        self.table.clearSpans()
-        self.table.setHorizontalHeaderLabels(headers)
+        # Disabling updates on the view covers its headers and viewport too: one repaint at the end
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.clearSpans()
+            self.model.set_rows(data)
+            if not data:
+                return
 
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
+            # Summary text of score-mode header rows spans the remaining columns
+            span = self.model.columnCount() - 2
+            for r in self.model.summary_rows():
+                self.table.setSpan(r, 2, 1, span)
+
+            self._fit_columns()
+            self._apply_row_heights()
+        finally:
+            self.table.setUpdatesEnabled(True)
+
+    def _apply_row_heights(self, first: int = 0):
+        """Size rows from their line count instead of measuring every cell's wrapped text."""
+        base = self.table.verticalHeader().defaultSectionSize()
+        line_h = self.table.fontMetrics().lineSpacing()
+        for r in range(first, self.model.rowCount()):
+            lines = self.model.line_count(r)
+            if lines == 0:
+                self.table.setRowHeight(r, 6)  # Separator between solutions
+            elif lines > 1:
+                self.table.setRowHeight(r, base + (lines - 1) * line_h)
+
+    def _capabilities_column(self) -> int:
+        return 4 if self.model.has_score() else 5
+
+    def _widest_capability_line(self, first: int, last: int) -> int:
+        fm = self.table.fontMetrics()
+        widest = 0
+        for r in range(first, min(last, self.model.rowCount())):
+            for line in self.model.capabilities_text(r).split("\n"):
+                widest = max(widest, fm.horizontalAdvance(line))
+        return widest
+
+    def _fit_capabilities_column(self, first: int):
+        """Widen the capabilities column for the rows appended from `first` on; it never shrinks here."""
+        cap_col = self._capabilities_column()
+        # Same text margin the style's item delegate leaves on each side of a cell
+        margin = self.table.style().pixelMetric(QStyle.PixelMetric.PM_FocusFrameHMargin, None, self.table) + 1
+        width = self._widest_capability_line(first, self.model.rowCount()) + 2 * margin
+        if width > self.table.columnWidth(cap_col):
+            self.table.setColumnWidth(cap_col, width)
+
+    def _fit_columns(self):
+        """Fit columns in one pass; a live ResizeToContents mode would re-measure on every change."""
+        header = self.table.horizontalHeader()
+        header.setSectionsClickable(False)
+        header.setSortIndicatorShown(False)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        # Samples the first 50 rows (setResizeContentsPrecision); wider later rows elide
+        self.table.resizeColumnsToContents()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
         self.table.setColumnWidth(0, 42)
-        cap_col_idx = 4 if has_score else 5
-        self.table.horizontalHeader().setSectionResizeMode(cap_col_idx, QHeaderView.ResizeMode.ResizeToContents)
-        self.table.horizontalHeader().setSectionsClickable(False)
-        self.table.horizontalHeader().setSortIndicatorShown(False)
-
-        self.table.setRowCount(len(data))
-
-        last_sol_id = -1
-        for r, row_data in enumerate(data):
-            if not row_data:
-                for c in range(self.table.columnCount()):
-                    item = QTableWidgetItem("")
-                    item.setFlags(Qt.ItemFlag.NoItemFlags)
-                    self.table.setItem(r, c, item)
-                continue
-
-            current_sol_id = row_data.get("solution_id", -1)
-
-            if has_score:
-                if row_data.get("is_solution_header"):
-                    # Checkbox and export ID are on the solution header row.
-                    if current_sol_id != -1:
-                        cb = CheckBox(self.table)
-                        cb.stateChanged.connect(lambda _state: self._update_export_button_state())
-                        self.table.setCellWidget(r, 0, cb)
-                    else:
-                        chk_item = QTableWidgetItem()
-                        chk_item.setFlags(Qt.ItemFlag.NoItemFlags)
-                        self.table.setItem(r, 0, chk_item)
-
-                    self.table.setItem(r, 1, QTableWidgetItem(str(current_sol_id if current_sol_id != -1 else "")))
-                    summary = f"Solution {current_sol_id}, Total Weighted Cost = {row_data.get('composite_score', 0):.2f}"
-                    summary_item = QTableWidgetItem(summary)
-                    summary_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                    self.table.setItem(r, 2, summary_item)
-                    self.table.setSpan(r, 2, 1, self.table.columnCount() - 2)
-                else:
-                    chk_item = QTableWidgetItem()
-                    chk_item.setFlags(Qt.ItemFlag.NoItemFlags)
-                    self.table.setItem(r, 0, chk_item)
-                    self.table.setItem(r, 1, QTableWidgetItem(""))
-                    self.table.setItem(r, 2, QTableWidgetItem(str(row_data.get("step_id", ""))))
-                    self.table.setItem(r, 3, QTableWidgetItem(str(row_data.get("resource", ""))))
-                    self.table.setItem(r, 4, QTableWidgetItem(self._format_capabilities_text(row_data.get("capabilities", ""))))
-                    self.table.setItem(r, 5, QTableWidgetItem(f"{row_data.get('energy_cost', 0):.1f}"))
-                    self.table.setItem(r, 6, QTableWidgetItem(f"{row_data.get('use_cost', 0):.1f}"))
-                    self.table.setItem(r, 7, QTableWidgetItem(f"{row_data.get('co2_footprint', 0):.1f}"))
-            else:
-                # checkbox: only show selectable checkbox for first row of each solution
-                if current_sol_id != last_sol_id and current_sol_id != -1:
-                    cb = CheckBox(self.table)
-                    cb.stateChanged.connect(lambda _state: self._update_export_button_state())
-                    self.table.setCellWidget(r, 0, cb)
-                    last_sol_id = current_sol_id
-                else:
-                    chk_item = QTableWidgetItem()
-                    chk_item.setFlags(Qt.ItemFlag.NoItemFlags)
-                    self.table.setItem(r, 0, chk_item)
-
-                self.table.setItem(r, 1, QTableWidgetItem(str(row_data.get("solution_id", ""))))
-                self.table.setItem(r, 2, QTableWidgetItem(str(row_data.get("step_id", ""))))
-                self.table.setItem(r, 3, QTableWidgetItem(str(row_data.get("description", ""))))
-                self.table.setItem(r, 4, QTableWidgetItem(str(row_data.get("resource", ""))))
-                self.table.setItem(r, 5, QTableWidgetItem(self._format_capabilities_text(row_data.get("capabilities", ""))))
-                status_item = QTableWidgetItem(str(row_data.get("status", "")))
-                status_item.setForeground(QColor("#28a745"))
-                self.table.setItem(r, 6, status_item)
-
-        self.table.blockSignals(False)
-        self.table.resizeRowsToContents()
-        self.table.setSortingEnabled(False)
-        self._update_export_button_state()
@@ -1,5 +1,6 @@
 # Code/GUI/Settings.py
 import os
+from PyQt6.QtCore import QSignalBlocker
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QFileDialog
 from qfluentwidgets import (
     CardWidget, IconWidget, BodyLabel, SwitchButton, CaptionLabel,
@@ -205,15 +206,26 @@ class SettingsPage(QWidget):
         
         others = [s for s in [self.spin_energy, self.spin_use, self.spin_co2] if s != source_spin]
         
-        for s in others: s.blockSignals(True)
-        
-        adjustment = delta / 2.0
-        for s in others:
-            curr = s.value()
-            s.setValue(max(0.0, min(1.0, curr - adjustment)))
-            self.prev_vals[s] = s.value()
-            
-        for s in others: s.blockSignals(False)
+        # Split what is left proportionally in one pass; the second spin takes the rounding
+        # remainder so the sum is exact and no clamp/correction cascade is needed.
+        target_sum = max(0.0, 1.0 - new_val)
+        curr_sum = others[0].value() + others[1].value()
+        if curr_sum > 1e-9:
+            first = target_sum * others[0].value() / curr_sum
+        else:
+            first = target_sum / 2.0
+        first = round(first, others[0].decimals())
+        values = (first, max(0.0, target_sum - first))
+
+        blockers = [QSignalBlocker(s) for s in others]
+        self.card_weights.setUpdatesEnabled(False)
+        try:
+            for s, value in zip(others, values):
+                s.setValue(value)
+                self.prev_vals[s] = s.value()
+        finally:
+            self.card_weights.setUpdatesEnabled(True)
+            for blocker in blockers: blocker.unblock()
 
     def toggle_theme(self, checked):
         """Switch between Light and Dark themes."""
@@ -2,9 +2,11 @@
 import sys
 import os
 import copy
+import time
 import traceback
+from collections import defaultdict
 from pathlib import Path
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 
 try:
     from Code.SMT4ModPlant.GeneralRecipeParser import parse_general_recipe
@@ -16,20 +18,42 @@ except ImportError as e:
     print("Import Error inside Workers.py: Could not load backend modules.")
     print(f"Specific Error: {e}")
 
-class SMTWorker(QThread):
-    """Background thread that handles parsing inputs, running calculation, and optional weighted sorting."""
+class SMTWorkerSignals(QObject):
+    """Signals emitted by SMTWorker; a QRunnable cannot own signals itself."""
     log_signal = pyqtSignal(str)
-    progress_signal = pyqtSignal(int, int)
+    total_signal = pyqtSignal(int)  # emitted once per run with the progress maximum
+    progress_signal = pyqtSignal(int)
     # [MODIFIED] Signal now carries (gui_data_list, context_dict)
     finished_signal = pyqtSignal(list, dict)
     error_signal = pyqtSignal(str)
+    partial_signal = pyqtSignal(list)  # All Results rows streamed while the search is running
 
-    def __init__(self, recipe_path, resource_dir, mode_index, weights):
+
+class SMTWorker(QRunnable):
+    """Pooled task that handles parsing inputs, running calculation, and optional weighted sorting."""
+
+    def __init__(self, signals, recipe_path, resource_dir, mode_index, weights):
         super().__init__()
+        # The signals holder outlives the task, so GUI connections are made only once.
+        self.signals = signals
         self.recipe_path = recipe_path
         self.resource_dir = resource_dir
         self.mode_index = mode_index  # 0: all results, 1: weighted sorted all results
         self.weights = weights 
+        self._row_buffer = []
+        self._last_row_flush = 0.0
+
+    def _stream_rows(self, rows):
+        """Buffer solution rows and hand them to the GUI in batches (~10 per second at most)."""
+        self._row_buffer.extend(rows)
+        if len(self._row_buffer) >= 200 or time.monotonic() - self._last_row_flush >= 0.1:
+            self._flush_rows()
+
+    def _flush_rows(self):
+        if self._row_buffer:
+            self.signals.partial_signal.emit(self._row_buffer)
+            self._row_buffer = []
+        self._last_row_flush = time.monotonic()
 
     @staticmethod
     def _select_preview_solution_id(json_solutions, mode_index, evaluated_solutions=None):
@@ -98,14 +122,15 @@ class SMTWorker(QThread):
         """Execute the end-to-end workflow: parse inputs, solve constraints, and optionally sort by weighted cost."""
         try:
             current_phase = "Recipe"
+            self.signals.total_signal.emit(100)
             # 1. Parsing
-            self.log_signal.emit(f"Parsing Recipe: {self.recipe_path}")
+            self.signals.log_signal.emit(f"Parsing Recipe: {self.recipe_path}")
             recipe_data = parse_general_recipe(self.recipe_path)
-            self.progress_signal.emit(10, 100)
+            self.signals.progress_signal.emit(10)
 
             # Build list of supported resource files up front to fail fast if empty
             current_phase = "AAS"
-            self.log_signal.emit(f"Scanning resource directory: {self.resource_dir}")
+            self.signals.log_signal.emit(f"Scanning resource directory: {self.resource_dir}")
             resource_files = [
                 f for f in os.listdir(self.resource_dir)
                 if f.lower().endswith(('.xml', '.aasx', '.json'))
@@ -120,7 +145,7 @@ class SMTWorker(QThread):
             for idx, filename in enumerate(resource_files):
                 full_path = os.path.join(self.resource_dir, filename)
                 res_name = Path(filename).stem
-                self.log_signal.emit(f"Parsing resource file: {filename}")
+                self.signals.log_signal.emit(f"Parsing resource file: {filename}")
                 
                 try:
                     caps = parse_capabilities_robust(full_path)
@@ -129,12 +154,12 @@ class SMTWorker(QThread):
                         all_capabilities[key_name] = caps
                 except Exception as parse_err:
                     # Keep running but warn; a hard failure will be caught later
-                    self.log_signal.emit(f"Warning: Failed to parse {filename}: {parse_err}")
+                    self.signals.log_signal.emit(f"Warning: Failed to parse {filename}: {parse_err}")
 
                 progress = 10 + int((idx + 1) / total_files * 20)
-                self.progress_signal.emit(progress, 100)
+                self.signals.progress_signal.emit(progress)
 
-            self.log_signal.emit(f"Loaded {len(all_capabilities)} valid resources.")
+            self.signals.log_signal.emit(f"Loaded {len(all_capabilities)} valid resources.")
             if not all_capabilities: raise ValueError("No valid resources loaded.")
 
             # 2. Calculation mode configuration
@@ -143,7 +168,7 @@ class SMTWorker(QThread):
             is_opt = (self.mode_index == 1)
             
             mode_names = ["All Results", "Weighted Sorted Results"]
-            self.log_signal.emit(f"Starting Calculation (Mode: {mode_names[self.mode_index]})...")
+            self.signals.log_signal.emit(f"Starting Calculation (Mode: {mode_names[self.mode_index]})...")
             
             # SMT run
             # Note: run_optimization returns (gui_results, json_solutions)
@@ -156,17 +181,20 @@ class SMTWorker(QThread):
             gui_results, json_solutions, debug_payload = run_optimization(
                 recipe_data, 
                 all_capabilities, 
-                log_callback=self.log_signal.emit, 
+                log_callback=self.signals.log_signal.emit, 
                 generate_json=True, # Always generate structure for export capability
-                find_all_solutions=find_all
+                find_all_solutions=find_all,
+                # Weighted mode needs every solution before it can sort, so only All Results streams
+                rows_callback=None if is_opt else self._stream_rows,
             )
+            self._flush_rows()
             
-            self.progress_signal.emit(60, 100)
+            self.signals.progress_signal.emit(60)
 
             # 3. Weighted mode: rank all solutions; default mode shows raw all results
             evaluated_solutions = []
             if is_opt and json_solutions:
-                self.log_signal.emit("Weighted mode: Calculating costs and sorting all solutions...")
+                self.signals.log_signal.emit("Weighted mode: Calculating costs and sorting all solutions...")
                 
                 optimizer = SolutionOptimizer()
                 optimizer.set_weights(*self.weights)
@@ -175,10 +203,15 @@ class SMTWorker(QThread):
                 evaluated_solutions = optimizer.optimize_solutions_from_memory(json_solutions)
                 
                 sorted_gui_results = []
+
+                # Group rows by solution once instead of rescanning gui_results per solution
+                rows_by_solution = defaultdict(list)
+                for r in gui_results:
+                    rows_by_solution[r.get('solution_id')].append(r)
                 
                 for idx, eval_sol in enumerate(evaluated_solutions):
                     sol_id = eval_sol['solution_id']
-                    rows = [r for r in gui_results if r.get('solution_id') == sol_id]
+                    rows = rows_by_solution.get(sol_id, ())
                     if not rows:
                         continue
 
@@ -208,9 +241,9 @@ class SMTWorker(QThread):
                 
                 gui_results = sorted_gui_results
                 if evaluated_solutions:
-                    self.log_signal.emit(f"Weighted sorting complete. Top Solution ID: {evaluated_solutions[0]['solution_id']}")
+                    self.signals.log_signal.emit(f"Weighted sorting complete. Top Solution ID: {evaluated_solutions[0]['solution_id']}")
 
-            self.progress_signal.emit(100, 100)
+            self.signals.progress_signal.emit(100)
 
             preview_solution_id = self._select_preview_solution_id(
                 json_solutions=json_solutions,
@@ -236,7 +269,7 @@ class SMTWorker(QThread):
                         selected_solution_id=preview_solution_id,
                     )
                 except Exception as preview_err:
-                    self.log_signal.emit(f"Warning: Failed to build Master Recipe preview: {preview_err}")
+                    self.signals.log_signal.emit(f"Warning: Failed to build Master Recipe preview: {preview_err}")
             
             # [NEW] Pack context for export
             # We need: Resources (all_capabilities), Solutions (json_solutions), General Recipe (recipe_data)
@@ -255,7 +288,7 @@ class SMTWorker(QThread):
                 'matching_debug': (debug_payload or {}).get('matching_debug', []),
             }
             
-            self.finished_signal.emit(gui_results, context_data)
+            self.signals.finished_signal.emit(gui_results, context_data)
 
         except Exception as e:
             # Map technical errors to user-friendly phases
@@ -266,5 +299,5 @@ class SMTWorker(QThread):
                 user_msg = "AAS file read error"
             else:
                 user_msg = "Calculation error"
-            self.error_signal.emit(user_msg)
-            self.log_signal.emit(traceback.format_exc())
+            self.signals.error_signal.emit(user_msg)
+            self.signals.log_signal.emit(traceback.format_exc())
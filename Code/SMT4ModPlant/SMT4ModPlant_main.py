@@ -558,7 +558,8 @@ def _append_solution_results_for_gui(
                 })
 
 
-def run_optimization(recipe_data, capabilities_data, log_callback=print, generate_json=False, find_all_solutions=True):
+def run_optimization(recipe_data, capabilities_data, log_callback=print, generate_json=False, find_all_solutions=True,
+                     rows_callback=None):
     """
     Solve the recipe-to-resource assignment problem using SMT.
 
@@ -568,6 +569,7 @@ def run_optimization(recipe_data, capabilities_data, log_callback=print, generat
         log_callback: Logger function (default: print)
         generate_json: If True, also build JSON solution objects
         find_all_solutions: If True, enumerate all solutions (with blocking clauses)
+        rows_callback: Optional callable receiving each solution's GUI rows as soon as it is found
 
     Returns:
         (gui_results_list, all_solutions_json_list, debug_payload)
@@ -624,6 +626,7 @@ def run_optimization(recipe_data, capabilities_data, log_callback=print, generat
                 )
                 all_json_solutions.append(solution_json)
 
+            first_new_row = len(all_results_for_gui)
             _append_solution_results_for_gui(
                 all_results_for_gui=all_results_for_gui,
                 solution_id=valid_solution_count,
@@ -633,6 +636,8 @@ def run_optimization(recipe_data, capabilities_data, log_callback=print, generat
                 model=model,
                 step_resource_to_caps_props=step_resource_to_caps_props,
             )
+            if rows_callback is not None:
+                rows_callback(all_results_for_gui[first_new_row:])
 
             if not find_all_solutions:
                 break
@@ -441,26 +441,30 @@ def generate_b2mml_master_recipe(
     # Use bytes output so xml_declaration is correct and stable.
     xml_bytes = ET.tostring(root, encoding="utf-8", xml_declaration=True)
 
-    # Pretty print
+    # Pretty print (kept as UTF-8 bytes; decoded only when a string is returned)
     try:
         dom = minidom.parseString(xml_bytes)
-        pretty_xml = dom.toprettyxml(indent="\t", encoding="utf-8").decode("utf-8")
+        pretty_bytes = dom.toprettyxml(indent="\t", encoding="utf-8")
     except Exception as e:
         print(f"Warning: Could not pretty-print XML: {e}")
-        pretty_xml = xml_bytes.decode("utf-8")
+        pretty_bytes = xml_bytes
 
     # Save or return
     if output_path:
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(pretty_xml)
+            file_bytes = pretty_bytes
+            if os.linesep != "\n":
+                # Same line endings a text-mode write produced (CRLF on Windows)
+                file_bytes = pretty_bytes.replace(b"\n", os.linesep.encode("ascii"))
+            with open(output_path, "wb") as f:
+                f.write(file_bytes)
             print(f"Successfully saved Master Recipe to: {output_path}")
             return output_path
         except Exception as e:
             print(f"Error saving file: {e}")
-            return pretty_xml
+            return pretty_bytes.decode("utf-8")
 
-    return pretty_xml
+    return pretty_bytes.decode("utf-8")
 
 
 def save_b2mml_xml(xml_content, filename="MasterRecipe_B2MML.xml"):
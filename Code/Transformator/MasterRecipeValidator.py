@@ -1,5 +1,8 @@
 # Code/Transformator/MasterRecipeValidator.py
+import os
 import re
+import time
+from collections import OrderedDict
 from pathlib import Path
 from lxml import etree
 
@@ -26,6 +29,57 @@ def _guess_root_xsd(allschema_dir: str) -> str:
     return str(xsds[0]) if xsds else ""
 
 
+# Compiled XSD sets keyed by (schema dir, root xsd, signature of every .xsd under the dir).
+# Compiling the BatchML set dominates a validation, so repeated runs reuse it until a file changes.
+_SCHEMA_CACHE_SIZE = 4
+_SCHEMA_CACHE: "OrderedDict[tuple, tuple[str, etree.XMLSchema]]" = OrderedDict()
+# Directory signatures are reused for a short while so back-to-back validations skip the walk
+_SCHEMA_SIG_TTL = 2.0
+_SCHEMA_SIG_CACHE: dict[str, tuple[float, tuple]] = {}
+
+
+def _schema_dir_signature(allschema_dir: str) -> tuple:
+    """(relative path, mtime_ns, size) of every .xsd under the dir, gathered in one scandir walk."""
+    entries = []
+    stack = [allschema_dir]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(".xsd"):
+                        st = entry.stat()
+                        entries.append((os.path.relpath(entry.path, allschema_dir), st.st_mtime_ns, st.st_size))
+                except OSError:
+                    continue  # Removed or unreadable mid-walk; the signature changes, so the cache misses
+    entries.sort()
+    return tuple(entries)
+
+
+def _schema_cache_key(allschema_dir: str, root_xsd_path: str | None) -> tuple:
+    root_sig = None
+    if root_xsd_path:
+        try:
+            st = os.stat(root_xsd_path)
+            root_sig = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            pass
+    schema_dir = os.path.abspath(allschema_dir)
+    now = time.monotonic()
+    cached = _SCHEMA_SIG_CACHE.get(schema_dir)
+    if cached is not None and now - cached[0] < _SCHEMA_SIG_TTL:
+        dir_sig = cached[1]
+    else:
+        dir_sig = _schema_dir_signature(allschema_dir)
+        _SCHEMA_SIG_CACHE[schema_dir] = (now, dir_sig)
+    return (schema_dir, root_xsd_path, root_sig, dir_sig)
+
+
 def validate_master_recipe_xml(
     master_recipe_xml_path: str,
     allschema_dir: str,
@@ -80,7 +134,13 @@ def validate_master_recipe_xml_detailed(
     Returns:
       ok(bool), errors(list[str]), used_root_xsd_path(str|None), details(list[dict])
     """
-    used_root = root_xsd_path or _guess_root_xsd(allschema_dir)
+    cache_key = _schema_cache_key(allschema_dir, root_xsd_path)
+    cached = _SCHEMA_CACHE.get(cache_key)
+    if cached is not None:
+        _SCHEMA_CACHE.move_to_end(cache_key)
+        used_root, schema = cached
+    else:
+        used_root, schema = root_xsd_path or _guess_root_xsd(allschema_dir), None
     if not used_root:
         msg = f"[XSD] No .xsd found under: {allschema_dir}"
         return False, [msg], None, [{
@@ -99,16 +159,20 @@ def validate_master_recipe_xml_detailed(
             "location": master_recipe_xml_path,
         }]
 
-    try:
-        xsd_doc = etree.parse(str(used_root))
-        schema = etree.XMLSchema(xsd_doc)
-    except Exception as e:
-        msg = f"[XSD] Failed to parse XSD ({used_root}): {e}"
-        return False, [msg], used_root, [{
-            "kind": "XSD_PARSE_ERROR",
-            "message": str(e),
-            "location": used_root,
-        }]
+    if schema is None:
+        try:
+            xsd_doc = etree.parse(str(used_root))
+            schema = etree.XMLSchema(xsd_doc)
+        except Exception as e:
+            msg = f"[XSD] Failed to parse XSD ({used_root}): {e}"
+            return False, [msg], used_root, [{
+                "kind": "XSD_PARSE_ERROR",
+                "message": str(e),
+                "location": used_root,
+            }]
+        _SCHEMA_CACHE[cache_key] = (used_root, schema)
+        if len(_SCHEMA_CACHE) > _SCHEMA_CACHE_SIZE:
+            _SCHEMA_CACHE.popitem(last=False)
 
     ok = schema.validate(xml_doc)
     errors: list[str] = []
@@ -12,10 +12,11 @@ import os
 
 
 # PyQt6 Imports
+from PyQt6.QtCore import QThread, QThreadPool, pyqtSlot
 from PyQt6.QtWidgets import QApplication
 from qfluentwidgets import (
     FluentWindow, NavigationItemPosition, FluentIcon, setTheme, Theme,
-    InfoBarPosition
+    InfoBarPosition, setThemeColor
 )
 from Code.GUI.Notifications import SafeInfoBar as InfoBar
 
@@ -34,6 +35,7 @@ class MainWindow(FluentWindow):
         super().__init__()
         self.setWindowTitle("Plant Configurator and Master Recipe Generator")
         setTheme(Theme.DARK)
+        setThemeColor("#00629B")  # Global accent; applied once for all pages
         self.resize(1200, 800) # Initial window size
         
         screen = QApplication.primaryScreen()
@@ -69,6 +71,7 @@ class MainWindow(FluentWindow):
 
         return ""
 
+    @pyqtSlot(str)
     def log_callback_shim(self, msg):
         """Bridge the worker log signal into the log page widget."""
         try:
@@ -97,6 +100,8 @@ class MainWindow(FluentWindow):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    # Calculations and folder scans share the global pool; keep cores free for the GUI.
+    QThreadPool.globalInstance().setMaxThreadCount(max(2, QThread.idealThreadCount() - 3))
     w = MainWindow()
     # w.show()
     w.showMaximized()  